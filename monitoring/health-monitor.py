@@ -11,8 +11,9 @@ import logging
 import time
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Awaitable, Callable, Dict, List, Any, Optional
+from dataclasses import dataclass
+from enum import StrEnum
 import sys
 
 # Configure logging
@@ -22,10 +23,44 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# MCP protocol endpoints to probe, in order of preference
+MCP_ENDPOINTS = (
+    '/mcp/tools',
+    '/mcp/resources',
+    '/mcp/prompts',
+    '/tools',
+    '/resources',
+    '/prompts'
+)
+
+# Severity rank of each check status, and the overall status for each rank
+STATUS_RANKS = {'healthy': 0, 'warning': 1, 'unhealthy': 2, 'error': 2}
+OVERALL_STATUSES = ('healthy', 'degraded', 'unhealthy')
+
+# Console icons for check statuses (anything else is shown as a failure)
+STATUS_ICONS = {
+    'healthy': "✅",
+    'warning': "⚠️",
+    'unhealthy': "❌",
+    'error': "❌"
+}
+
+class Severity(StrEnum):
+    """Issue severity levels"""
+    HIGH = 'high'
+    MEDIUM = 'medium'
+    LOW = 'low'
+
+class IssueType(StrEnum):
+    """Issue categories reported by analyze_metrics"""
+    PERFORMANCE = 'performance'
+    RESOURCE = 'resource'
+    RELIABILITY = 'reliability'
+
 @dataclass
 class HealthMetrics:
     """Health metrics data structure"""
-    timestamp: str
+    timestamp: int  # Wall-clock epoch milliseconds
     status: str
     response_time_ms: float
     memory_usage_mb: Optional[float] = None
@@ -33,6 +68,10 @@ class HealthMetrics:
     active_connections: Optional[int] = None
     error_rate: Optional[float] = None
     uptime_seconds: Optional[float] = None
+    
+    def timestamp_iso(self) -> str:
+        """Format the timestamp as ISO 8601 for display/serialization"""
+        return datetime.fromtimestamp(self.timestamp / 1000).isoformat()
 
 @dataclass
 class HealthCheckResult:
@@ -42,6 +81,18 @@ class HealthCheckResult:
     checks: Dict[str, Dict[str, Any]]
     issues: List[Dict[str, str]]
     recommendations: List[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Build a JSON-ready dict without asdict()'s recursive deep copy"""
+        metrics = dict(vars(self.metrics))
+        metrics['timestamp'] = self.metrics.timestamp_iso()
+        return {
+            'overall_status': self.overall_status,
+            'metrics': metrics,
+            'checks': self.checks,
+            'issues': self.issues,
+            'recommendations': self.recommendations
+        }
 
 class TelnyxMCPHealthMonitor:
     """Production-ready health monitor for Telnyx MCP Server"""
@@ -49,7 +100,15 @@ class TelnyxMCPHealthMonitor:
     def __init__(self, base_url: str = "http://localhost:8080"):
         self.base_url = base_url.rstrip('/')
         self.session: Optional[aiohttp.ClientSession] = None
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self._mcp_endpoint: Optional[str] = None
+        self._cache: Dict[str, tuple[float, Dict[str, Any]]] = {}
+        # URLs that answered HEAD with 405/501, so later ticks skip straight to GET
+        self._head_unsupported: set[str] = set()
+        self.cache_ttls = {
+            'authentication': 300,  # 5 minutes
+            'external_connectivity': 120,  # 2 minutes
+        }
         self.alert_thresholds = {
             'response_time_ms': 5000,  # 5 seconds
             'error_rate': 0.1,  # 10%
@@ -59,7 +118,18 @@ class TelnyxMCPHealthMonitor:
         
     async def __aenter__(self):
         """Async context manager entry"""
+        # Pooled keep-alive connector so TCP/TLS setup is amortized across ticks.
+        # HTTP/2 multiplexing isn't used: the local server is plain http (no ALPN
+        # upgrade), so concurrent checks instead share warm pooled connections.
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
         self.session = aiohttp.ClientSession(
+            connector=connector,
             timeout=aiohttp.ClientTimeout(total=10)
         )
         return self
@@ -69,6 +139,35 @@ class TelnyxMCPHealthMonitor:
         if self.session:
             await self.session.close()
     
+    async def _cached(self, name: str, ttl: float,
+                      check: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Return a recent result for a slow-changing check, re-running it once stale"""
+        cached = self._cache.get(name)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
+        result = await check()
+        if result['status'] == 'healthy':
+            self._cache[name] = (time.monotonic(), result)
+        else:
+            # Don't cache failures so recovery is picked up on the next tick
+            self._cache.pop(name, None)
+        return result
+    
+    async def _fetch_status(self, url: str) -> int:
+        """Get the HTTP status of a URL without transferring its body"""
+        if url not in self._head_unsupported:
+            async with self.session.head(url, allow_redirects=True) as response:
+                if response.status not in (405, 501):
+                    return response.status
+            self._head_unsupported.add(url)
+        
+        # Server doesn't support HEAD; ask for a single byte instead
+        async with self.session.get(url, headers={'Range': 'bytes=0-0'}) as response:
+            await response.read()  # Drain so the connection returns to the pool
+            # 206 Partial Content is just the ranged form of 200 OK
+            return 200 if response.status == 206 else response.status
+    
     async def check_basic_health(self) -> Dict[str, Any]:
         """Basic HTTP health check"""
         check_result = {
@@ -79,33 +178,33 @@ class TelnyxMCPHealthMonitor:
         }
         
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             
             # Try health endpoint first
             try:
-                async with self.session.get(f"{self.base_url}/health") as response:
-                    response_time = (time.time() - start_time) * 1000
-                    check_result['response_time_ms'] = response_time
-                    
-                    if response.status == 200:
-                        check_result['status'] = 'healthy'
-                        check_result['message'] = 'Health endpoint responding normally'
-                    else:
-                        check_result['status'] = 'unhealthy'
-                        check_result['message'] = f'Health endpoint returned status {response.status}'
+                status = await self._fetch_status(f"{self.base_url}/health")
+                response_time = (time.monotonic() - start_time) * 1000
+                check_result['response_time_ms'] = response_time
+                
+                if status == 200:
+                    check_result['status'] = 'healthy'
+                    check_result['message'] = 'Health endpoint responding normally'
+                else:
+                    check_result['status'] = 'unhealthy'
+                    check_result['message'] = f'Health endpoint returned status {status}'
                         
             except aiohttp.ClientConnectorError:
                 # If health endpoint doesn't exist, try root endpoint
-                async with self.session.get(f"{self.base_url}/") as response:
-                    response_time = (time.time() - start_time) * 1000
-                    check_result['response_time_ms'] = response_time
-                    
-                    if response.status in [200, 404]:  # 404 is acceptable for root
-                        check_result['status'] = 'healthy'
-                        check_result['message'] = 'Server responding (no health endpoint)'
-                    else:
-                        check_result['status'] = 'unhealthy'
-                        check_result['message'] = f'Server returned status {response.status}'
+                status = await self._fetch_status(f"{self.base_url}/")
+                response_time = (time.monotonic() - start_time) * 1000
+                check_result['response_time_ms'] = response_time
+                
+                if status in [200, 404]:  # 404 is acceptable for root
+                    check_result['status'] = 'healthy'
+                    check_result['message'] = 'Server responding (no health endpoint)'
+                else:
+                    check_result['status'] = 'unhealthy'
+                    check_result['message'] = f'Server returned status {status}'
                         
         except Exception as e:
             check_result['status'] = 'error'
@@ -113,6 +212,46 @@ class TelnyxMCPHealthMonitor:
             
         return check_result
     
+    async def _probe_mcp_endpoint(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Fetch an MCP listing endpoint, returning its payload on success"""
+        try:
+            async with self.session.get(f"{self.base_url}{endpoint}") as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if isinstance(data, dict):
+                        return data
+        except Exception:
+            pass
+        return None
+    
+    async def _discover_mcp_endpoint(self) -> tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Probe all MCP endpoints concurrently, stopping at the first that lists tools"""
+        tasks = {
+            asyncio.create_task(self._probe_mcp_endpoint(endpoint)): endpoint
+            for endpoint in MCP_ENDPOINTS
+        }
+        found = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    payload = task.result()
+                    if payload is None:
+                        continue
+                    if 'tools' in payload:
+                        return tasks[task], payload
+                    found[tasks[task]] = payload
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        # No endpoint listed tools; fall back to the most preferred one that answered
+        for endpoint in MCP_ENDPOINTS:
+            if endpoint in found:
+                return endpoint, found[endpoint]
+        return None, None
+    
     async def check_mcp_capabilities(self) -> Dict[str, Any]:
         """Check MCP server capabilities"""
         check_result = {
@@ -126,29 +265,29 @@ class TelnyxMCPHealthMonitor:
         
         try:
             # Test MCP protocol endpoints (if available)
-            endpoints_to_check = [
-                '/mcp/tools',
-                '/mcp/resources', 
-                '/mcp/prompts',
-                '/tools',
-                '/resources',
-                '/prompts'
-            ]
+            data = None
+            
+            # Go straight to the endpoint that listed tools on a previous tick
+            if self._mcp_endpoint:
+                data = await self._probe_mcp_endpoint(self._mcp_endpoint)
+                if data is None or 'tools' not in data:
+                    data = None
+                    self._mcp_endpoint = None
             
-            for endpoint in endpoints_to_check:
-                try:
-                    async with self.session.get(f"{self.base_url}{endpoint}") as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            if 'tools' in data:
-                                check_result['tools_count'] = len(data.get('tools', []))
-                            if 'resources' in data:
-                                check_result['resources_count'] = len(data.get('resources', []))
-                            if 'prompts' in data:
-                                check_result['prompts_count'] = len(data.get('prompts', []))
-                            break
-                except Exception:
-                    continue
+            # Only remember an endpoint that lists tools, so a fallback answer
+            # does not stop later ticks from finding a recovered tools endpoint
+            if data is None:
+                endpoint, data = await self._discover_mcp_endpoint()
+                if data is not None and 'tools' in data:
+                    self._mcp_endpoint = endpoint
+            
+            if data is not None:
+                if 'tools' in data:
+                    check_result['tools_count'] = len(data.get('tools', []))
+                if 'resources' in data:
+                    check_result['resources_count'] = len(data.get('resources', []))
+                if 'prompts' in data:
+                    check_result['prompts_count'] = len(data.get('prompts', []))
                     
             if check_result['tools_count'] > 0:
                 check_result['status'] = 'healthy'
@@ -205,14 +344,14 @@ class TelnyxMCPHealthMonitor:
         
         try:
             # Test connectivity to Telnyx API
-            async with self.session.get('https://api.telnyx.com/v2/') as response:
-                if response.status in [200, 401, 403]:  # Any of these means API is reachable
-                    check_result['api_reachable'] = True
-                    check_result['status'] = 'healthy'
-                    check_result['message'] = 'Telnyx API is reachable'
-                else:
-                    check_result['status'] = 'warning'
-                    check_result['message'] = f'Telnyx API returned unexpected status {response.status}'
+            status = await self._fetch_status('https://api.telnyx.com/v2/')
+            if status in [200, 401, 403]:  # Any of these means API is reachable
+                check_result['api_reachable'] = True
+                check_result['status'] = 'healthy'
+                check_result['message'] = 'Telnyx API is reachable'
+            else:
+                check_result['status'] = 'warning'
+                check_result['message'] = f'Telnyx API returned unexpected status {status}'
                     
         except Exception as e:
             check_result['status'] = 'error'
@@ -228,8 +367,8 @@ class TelnyxMCPHealthMonitor:
         # Check response time
         if metrics.response_time_ms > self.alert_thresholds['response_time_ms']:
             issues.append({
-                'type': 'performance',
-                'severity': 'high',
+                'type': IssueType.PERFORMANCE,
+                'severity': Severity.HIGH,
                 'message': f'High response time: {metrics.response_time_ms:.0f}ms'
             })
             recommendations.append('Consider optimizing server performance or increasing resources')
@@ -237,8 +376,8 @@ class TelnyxMCPHealthMonitor:
         # Check memory usage
         if metrics.memory_usage_mb and metrics.memory_usage_mb > self.alert_thresholds['memory_usage_mb']:
             issues.append({
-                'type': 'resource',
-                'severity': 'medium',
+                'type': IssueType.RESOURCE,
+                'severity': Severity.MEDIUM,
                 'message': f'High memory usage: {metrics.memory_usage_mb:.0f}MB'
             })
             recommendations.append('Monitor memory usage and consider increasing memory limits')
@@ -246,8 +385,8 @@ class TelnyxMCPHealthMonitor:
         # Check error rate
         if metrics.error_rate and metrics.error_rate > self.alert_thresholds['error_rate']:
             issues.append({
-                'type': 'reliability',
-                'severity': 'high',
+                'type': IssueType.RELIABILITY,
+                'severity': Severity.HIGH,
                 'message': f'High error rate: {metrics.error_rate:.1%}'
             })
             recommendations.append('Investigate server logs for error patterns')
@@ -256,36 +395,53 @@ class TelnyxMCPHealthMonitor:
     
     async def perform_comprehensive_health_check(self) -> HealthCheckResult:
         """Perform comprehensive health check"""
-        start_time = time.time()
+        start_time = time.monotonic()
+        
+        # Run all health checks concurrently
+        check_names = ('basic_health', 'mcp_capabilities', 'authentication', 'external_connectivity')
+        results = await asyncio.gather(
+            self.check_basic_health(),
+            self.check_mcp_capabilities(),
+            self._cached('authentication', self.cache_ttls['authentication'],
+                         self.check_authentication),
+            self._cached('external_connectivity', self.cache_ttls['external_connectivity'],
+                         self.check_external_connectivity),
+            return_exceptions=True
+        )
         
-        # Run all health checks
         checks = {}
-        checks['basic_health'] = await self.check_basic_health()
-        checks['mcp_capabilities'] = await self.check_mcp_capabilities()
-        checks['authentication'] = await self.check_authentication()
-        checks['external_connectivity'] = await self.check_external_connectivity()
+        for name, result in zip(check_names, results):
+            if isinstance(result, BaseException):
+                # A single failing check should not abort the whole batch
+                result = {
+                    'name': name,
+                    'status': 'error',
+                    'message': str(result)
+                }
+            checks[name] = result
         
         # Calculate overall response time
-        total_response_time = (time.time() - start_time) * 1000
+        now = time.monotonic()
+        total_response_time = (now - start_time) * 1000
         
         # Create metrics
         metrics = HealthMetrics(
-            timestamp=datetime.now().isoformat(),
+            timestamp=time.time_ns() // 1_000_000,
             status='healthy',
             response_time_ms=total_response_time,
-            uptime_seconds=time.time() - self.start_time
+            uptime_seconds=now - self.start_time
         )
         
         # Determine overall status
-        statuses = [check['status'] for check in checks.values()]
-        if 'error' in statuses:
-            overall_status = 'unhealthy'
-            metrics.status = 'unhealthy'
-        elif 'warning' in statuses:
-            overall_status = 'degraded'
-            metrics.status = 'degraded'
-        else:
-            overall_status = 'healthy'
+        worst = 0
+        for check in checks.values():
+            rank = STATUS_RANKS.get(check['status'], 2)
+            if rank > worst:
+                worst = rank
+                if worst == 2:
+                    break
+        overall_status = OVERALL_STATUSES[worst]
+        metrics.status = overall_status
         
         # Analyze metrics for issues and recommendations
         issues, recommendations = self.analyze_metrics(metrics)
@@ -300,40 +456,47 @@ class TelnyxMCPHealthMonitor:
     
     async def continuous_monitoring(self, interval_seconds: int = 30, duration_seconds: Optional[int] = None):
         """Run continuous monitoring"""
-        logger.info(f"Starting continuous monitoring (interval: {interval_seconds}s)")
+        logger.info("Starting continuous monitoring (interval: %ss)", interval_seconds)
         
         end_time = None
         if duration_seconds:
-            end_time = time.time() + duration_seconds
+            end_time = time.monotonic() + duration_seconds
+        
+        # Ticks follow a fixed schedule so check latency doesn't accumulate as drift
+        next_tick = time.monotonic()
         
         while True:
             try:
                 result = await self.perform_comprehensive_health_check()
                 
                 # Log health status
-                logger.info(f"Health Status: {result.overall_status} "
-                           f"(Response Time: {result.metrics.response_time_ms:.0f}ms)")
+                logger.info("Health Status: %s (Response Time: %.0fms)",
+                            result.overall_status, result.metrics.response_time_ms)
                 
                 # Log any issues
                 for issue in result.issues:
-                    logger.warning(f"Issue ({issue['severity']}): {issue['message']}")
+                    logger.warning("Issue (%s): %s", issue['severity'], issue['message'])
                 
                 # Log recommendations
                 for rec in result.recommendations:
-                    logger.info(f"Recommendation: {rec}")
+                    logger.info("Recommendation: %s", rec)
                 
                 # Check if we should stop
-                if end_time and time.time() >= end_time:
+                if end_time and time.monotonic() >= end_time:
                     break
-                    
-                await asyncio.sleep(interval_seconds)
                 
             except KeyboardInterrupt:
                 logger.info("Monitoring stopped by user")
                 break
             except Exception as e:
-                logger.error(f"Monitoring error: {e}")
-                await asyncio.sleep(interval_seconds)
+                logger.error("Monitoring error: %s", e)
+            
+            next_tick += interval_seconds
+            now = time.monotonic()
+            if now - next_tick > interval_seconds:
+                # More than a whole interval behind; resync instead of bursting catch-up ticks
+                next_tick = now + interval_seconds
+            await asyncio.sleep(max(0.0, next_tick - now))
 
 async def main():
     """Main entry point"""
@@ -360,18 +523,18 @@ async def main():
             result = await monitor.perform_comprehensive_health_check()
             
             if args.json:
-                print(json.dumps(asdict(result), indent=2))
+                print(json.dumps(result.to_dict(), indent=2))
             else:
                 print(f"\n=== Telnyx MCP Server Health Check ===")
                 print(f"Overall Status: {result.overall_status}")
-                print(f"Timestamp: {result.metrics.timestamp}")
+                print(f"Timestamp: {result.metrics.timestamp_iso()}")
                 print(f"Response Time: {result.metrics.response_time_ms:.0f}ms")
                 if result.metrics.uptime_seconds:
                     print(f"Uptime: {result.metrics.uptime_seconds:.0f}s")
                 
                 print("\n=== Check Results ===")
                 for name, check in result.checks.items():
-                    status_icon = "✅" if check['status'] == 'healthy' else "⚠️" if check['status'] == 'warning' else "❌"
+                    status_icon = STATUS_ICONS.get(check['status'], "❌")
                     print(f"{status_icon} {check['name']}: {check['status']} - {check['message']}")
                 
                 if result.issues:
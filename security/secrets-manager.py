@@ -4,37 +4,84 @@ Secure secrets management for Telnyx MCP Server
 Handles secure storage and retrieval of API keys and other sensitive data
 """
 
+import asyncio
 import os
 import json
 import base64
+import binascii
 import logging
 from typing import Dict, Optional, Any
 from pathlib import Path
 import hashlib
 import hmac
+import threading
+from datetime import datetime
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 logger = logging.getLogger(__name__)
 
+# Work factor for deriving the master key from a passphrase
+PBKDF2_ITERATIONS = 200_000
+
+# Lazily created keep-alive session for API key validation
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def _get_http_session():
+    """Return a shared requests session so connections to the Telnyx API are pooled"""
+    global _http_session
+    if _http_session is None:
+        import requests
+        with _http_session_lock:
+            if _http_session is None:
+                _http_session = requests.Session()
+    return _http_session
+
+def _stat_key(st: os.stat_result) -> tuple[int, int, int]:
+    """Identify a file version; mtime alone misses same-tick writes and replaced files"""
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+def _write_private_file(path: Path, data: bytes) -> tuple[int, int, int]:
+    """Write data to a file created read/write for owner only, returning its stat key"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+        f.flush()
+        return _stat_key(os.fstat(fd))
+
 class SecretsManager:
     """Secure secrets management for MCP server"""
     
     def __init__(self, secrets_file: Optional[str] = None):
         self.secrets_file = Path(secrets_file) if secrets_file else Path.home() / '.telnyx-mcp' / 'secrets.enc'
         self.secrets_file.parent.mkdir(parents=True, exist_ok=True)
+        self._secrets_path = os.fspath(self.secrets_file)  # Avoids Path overhead per stat
         
         # Get or create master key from environment
         self.master_key = self._get_or_create_master_key()
         self.cipher = self._create_cipher(self.master_key)
+        
+        # Decrypted secrets keyed by the file's (mtime, size, inode), so repeat reads
+        # skip Fernet. Callers must not mutate the cached dict; mutators copy it.
+        self._cache: Optional[tuple[tuple[int, int, int], Dict[str, Any]]] = None
     
     def _get_or_create_master_key(self) -> bytes:
         """Get master key from environment or create new one"""
         # Try to get from environment first
         env_key = os.environ.get('TELNYX_MCP_MASTER_KEY')
         if env_key:
-            return base64.urlsafe_b64decode(env_key.encode())
+            # Fast path: an exported Fernet key (as printed when one is generated)
+            try:
+                key = base64.urlsafe_b64decode(env_key.encode())
+                if len(base64.urlsafe_b64decode(key)) == 32:
+                    return key
+            except (binascii.Error, ValueError):
+                pass
+            
+            # Otherwise treat it as a passphrase and derive a Fernet key from it
+            return self._derive_master_key(env_key)
         
         # Check if key file exists
         key_file = self.secrets_file.parent / '.master_key'
@@ -51,9 +98,7 @@ class SecretsManager:
         
         # Save to file with restricted permissions
         try:
-            key_file.touch(mode=0o600)  # Read/write for owner only
-            with open(key_file, 'wb') as f:
-                f.write(master_key)
+            _write_private_file(key_file, master_key)
             logger.info(f"Master key saved to {key_file}")
             logger.info("To use the same key in other environments, set TELNYX_MCP_MASTER_KEY:")
             logger.info(f"export TELNYX_MCP_MASTER_KEY={base64.urlsafe_b64encode(master_key).decode()}")
@@ -62,24 +107,58 @@ class SecretsManager:
         
         return master_key
     
+    def _derive_master_key(self, passphrase: str) -> bytes:
+        """Derive a Fernet key from a passphrase using PBKDF2 and a persisted salt"""
+        salt_file = self.secrets_file.parent / '.master_salt'
+        salt = None
+        if salt_file.exists():
+            try:
+                with open(salt_file, 'rb') as f:
+                    salt = f.read()
+            except Exception as e:
+                logger.warning(f"Could not read master key salt file: {e}")
+        
+        if not salt:
+            salt = os.urandom(16)
+            try:
+                _write_private_file(salt_file, salt)
+            except Exception as e:
+                logger.warning(f"Could not save master key salt to file: {e}")
+        
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            iterations=PBKDF2_ITERATIONS
+        )
+        return base64.urlsafe_b64encode(kdf.derive(passphrase.encode()))
+    
     def _create_cipher(self, key: bytes) -> Fernet:
         """Create cipher for encryption/decryption"""
         return Fernet(key)
     
     def _load_secrets(self) -> Dict[str, Any]:
         """Load and decrypt secrets from file"""
-        if not self.secrets_file.exists():
+        try:
+            stat_key = _stat_key(os.stat(self._secrets_path))
+        except FileNotFoundError:
+            self._cache = None
             return {}
         
+        if self._cache and self._cache[0] == stat_key:
+            return self._cache[1]
+        
         try:
-            with open(self.secrets_file, 'rb') as f:
+            with open(self._secrets_path, 'rb') as f:
                 encrypted_data = f.read()
             
             if not encrypted_data:
                 return {}
             
             decrypted_data = self.cipher.decrypt(encrypted_data)
-            return json.loads(decrypted_data.decode())
+            secrets = json.loads(decrypted_data.decode())
+            self._cache = (stat_key, secrets)
+            return secrets
         
         except Exception as e:
             logger.error(f"Failed to load secrets: {e}")
@@ -87,14 +166,14 @@ class SecretsManager:
     
     def _save_secrets(self, secrets: Dict[str, Any]) -> None:
         """Encrypt and save secrets to file"""
+        self._cache = None
         try:
-            json_data = json.dumps(secrets, indent=2).encode()
+            json_data = json.dumps(secrets, separators=(',', ':')).encode()
             encrypted_data = self.cipher.encrypt(json_data)
             
-            # Write with restricted permissions
-            self.secrets_file.touch(mode=0o600)  # Read/write for owner only
-            with open(self.secrets_file, 'wb') as f:
-                f.write(encrypted_data)
+            # Write with restricted permissions; only a successful write updates the cache
+            stat_key = _write_private_file(self.secrets_file, encrypted_data)
+            self._cache = (stat_key, secrets)
             
             logger.info(f"Secrets saved to {self.secrets_file}")
         
@@ -104,13 +183,13 @@ class SecretsManager:
     
     def set_secret(self, key: str, value: str, description: Optional[str] = None) -> None:
         """Set a secret value"""
-        secrets = self._load_secrets()
+        secrets = dict(self._load_secrets())  # Copy so a failed save leaves the cache intact
         
         secrets[key] = {
             'value': value,
             'description': description or f'Secret value for {key}',
             'created_at': str(datetime.now()),
-            'hash': hashlib.sha256(value.encode()).hexdigest()[:16]  # For verification
+            'hash': hashlib.blake2b(value.encode(), digest_size=8).hexdigest()  # For verification
         }
         
         self._save_secrets(secrets)
@@ -123,7 +202,7 @@ class SecretsManager:
         if env_value:
             return env_value
         
-        # Then try encrypted secrets file
+        # Then try encrypted secrets file (a single stat when the cache is fresh)
         secrets = self._load_secrets()
         secret_data = secrets.get(key)
         
@@ -135,6 +214,10 @@ class SecretsManager:
         
         return default
     
+    async def get_secret_async(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a secret value from async code, decrypting off the event loop"""
+        return await asyncio.to_thread(self.get_secret, key, default)
+    
     def list_secrets(self) -> Dict[str, Dict[str, Any]]:
         """List all stored secrets (without values)"""
         secrets = self._load_secrets()
@@ -152,7 +235,7 @@ class SecretsManager:
     
     def delete_secret(self, key: str) -> bool:
         """Delete a secret"""
-        secrets = self._load_secrets()
+        secrets = dict(self._load_secrets())  # Copy so a failed save leaves the cache intact
         
         if key in secrets:
             del secrets[key]
@@ -190,8 +273,7 @@ class SecretsManager:
         
         # Test connectivity (optional, requires network access)
         try:
-            import requests
-            response = requests.get(
+            response = _get_http_session().get(
                 'https://api.telnyx.com/v2/',
                 headers={'Authorization': f'Bearer {api_key}'},
                 timeout=10
@@ -239,7 +321,6 @@ class SecretsManager:
 def main():
     """CLI interface for secrets management"""
     import argparse
-    from datetime import datetime
     
     parser = argparse.ArgumentParser(description='Telnyx MCP Server Secrets Manager')
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
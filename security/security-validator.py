@@ -14,13 +14,175 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import yaml
 
+try:
+    import orjson  # Optional faster JSON encoder for --json output
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml-backed parser
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Scan files across processes only when there are enough to outweigh pool startup
+PARALLEL_SCAN_MIN_FILES = 64
+SCAN_BATCH_SIZE = 16
+
+# File extensions to scan, as a tuple for a single str.endswith() call
+SCAN_EXTENSIONS = ('.py', '.js', '.ts', '.sh', '.yaml', '.yml', '.json', '.dockerfile')
+
+# Directories to prune from the walk (test files, caches, VCS data, etc.)
+SCAN_EXCLUDE_DIRS = frozenset({'tests', 'monitoring', '.git', '__pycache__', '.pytest_cache', 'node_modules'})
+
+# Files to exclude from scanning (security tools, example-heavy files)
+SCAN_EXCLUDE_FILES = (
+    '/security/security-validator.py',
+    '/security/secrets-manager.py',
+    '/telnyx.yml',  # OpenAPI spec file contains example data
+    '/deploy.sh'   # Deployment script may contain example URLs
+)
+
+# Files larger than this are skipped, as are files with a NUL byte in their first block
+MAX_SCAN_FILE_SIZE = 2 * 1024 * 1024
+BINARY_SNIFF_SIZE = 8192
+
+# Severity, title, description and recommendation for each issue type.
+# Descriptions may reference the offending line as {line}.
+ISSUE_DETAILS = {
+    'potential_secret_exposure': (
+        'high',
+        'Potential secret exposure in source code',
+        'Line contains what appears to be a hardcoded secret: {line}...',
+        'Move secrets to environment variables or secure configuration'
+    ),
+    'telnyx_api_key_exposure': (
+        'critical',
+        'Telnyx API key exposed in source code',
+        'Telnyx API key found in source code',
+        'Remove API key from source code and use environment variables'
+    ),
+    'stripe_key_exposure': (
+        'critical',
+        'Stripe API key exposed in source code',
+        'Stripe API key found in source code',
+        'Remove API key from source code and use environment variables'
+    ),
+    'aws_access_key_exposure': (
+        'critical',
+        'AWS access key exposed in source code',
+        'AWS access key found in source code',
+        'Remove access key from source code and use IAM roles or environment variables'
+    ),
+    'command_injection_risk': (
+        'high',
+        'Command injection vulnerability risk',
+        'Use of os.system() can lead to command injection',
+        'Use subprocess with shell=False or parameterized commands'
+    ),
+    'shell_injection_risk': (
+        'high',
+        'Shell injection vulnerability risk',
+        'Use of shell=True in subprocess can lead to injection',
+        'Use subprocess without shell=True or validate input thoroughly'
+    ),
+    'code_injection_risk': (
+        'critical',
+        'Code injection vulnerability risk',
+        'Use of eval() or exec() can lead to code injection',
+        'Avoid eval() and exec(); use safer alternatives for dynamic code execution'
+    ),
+    'insecure_http_usage': (
+        'medium',
+        'Insecure HTTP usage',
+        'HTTP URLs found - data transmitted in plaintext',
+        'Use HTTPS URLs for secure communication'
+    ),
+    'ssl_verification_disabled': (
+        'high',
+        'SSL verification disabled',
+        'SSL certificate verification is disabled',
+        'Enable SSL verification for secure connections'
+    ),
+    'debug_mode_enabled': (
+        'medium',
+        'Debug mode enabled',
+        'Debug mode can expose sensitive information',
+        'Disable debug mode in production environments'
+    ),
+    'insecure_flag_usage': (
+        'medium',
+        'Insecure flag usage',
+        'Insecure flags found in configuration',
+        'Remove insecure flags from production configuration'
+    ),
+}
+
+DEFAULT_ISSUE_DETAILS = (
+    'info',
+    'Security consideration',
+    'Potential security issue detected',
+    'Review and assess security implications'
+)
+
+# Literal text (lowercase) at least one of which must appear, in any case, for an
+# issue type's patterns to match; files are prefiltered with these before regexing
+ISSUE_LITERALS = {
+    'potential_secret_exposure': (b'key', b'password', b'passwd', b'secret', b'token', b'pwd'),
+    'telnyx_api_key_exposure': (b'key',),
+    'stripe_key_exposure': (b'sk_',),
+    'aws_access_key_exposure': (b'akia',),
+    'command_injection_risk': (b'os.system',),
+    'shell_injection_risk': (b'shell',),
+    'code_injection_risk': (b'eval', b'exec'),
+    'insecure_http_usage': (b'http://',),
+    'ssl_verification_disabled': (b'verify',),
+    'debug_mode_enabled': (b'debug',),
+    'insecure_flag_usage': (b'--insecure',),
+}
+
+# Environment variable names that suggest plaintext secrets (e.g. DB_PASSWORD).
+# PWD is deliberately absent: it is the shell's working directory.
+SENSITIVE_ENV_VAR = re.compile(r'(?:^|_)(?:PASSWORD|PASSWD|SECRET|TOKEN|API_?KEY)$')
+
+# Line separator, used to index line offsets in scanned files
+NEWLINE = re.compile(rb'\n')
+
+# Dockerfile instruction checks
+DOCKERFILE_USER_NON_ROOT = re.compile(r'^USER\s+(?!root)')
+DOCKERFILE_USER_ROOT = re.compile(r'^USER\s+root')
+DOCKERFILE_APT_INSTALL = re.compile(r'apt-get\s+update.*&&.*apt-get\s+install')
+DOCKERFILE_CHOWN_ROOT = re.compile(r'^(?:COPY|ADD).*--chown=root')
+
+# Security score deduction per finding of each severity
+SEVERITY_DEDUCTIONS = {'critical': 30, 'high': 20, 'medium': 10, 'low': 5}
+
+# Security category for each issue type
+ISSUE_CATEGORIES = {
+    'potential_secret_exposure': 'secrets',
+    'telnyx_api_key_exposure': 'secrets',
+    'stripe_key_exposure': 'secrets',
+    'aws_access_key_exposure': 'secrets',
+    'command_injection_risk': 'injection',
+    'shell_injection_risk': 'injection',
+    'code_injection_risk': 'injection',
+    'insecure_http_usage': 'network',
+    'ssl_verification_disabled': 'network',
+    'debug_mode_enabled': 'configuration',
+    'insecure_flag_usage': 'configuration',
+}
+
+@dataclass(slots=True, frozen=True)
 class SecurityFinding:
     """Security finding data structure"""
     severity: str  # critical, high, medium, low, info
@@ -35,32 +197,79 @@ class TelnyxMCPSecurityValidator:
     """Comprehensive security validator for Telnyx MCP Server"""
     
     def __init__(self, project_path: str):
-        self.project_path = Path(project_path)
+        # Resolved so walked paths and the root prefix below always agree
+        self.project_path = Path(project_path).resolve()
         self.findings: List[SecurityFinding] = []
+        self._config_cache: Dict[Path, Tuple[int, Any]] = {}
+        self._report: Optional[Dict[str, Any]] = None
+        self._root_prefix = os.path.join(str(self.project_path), '')
         
-        # Security patterns and rules
+        # Security patterns and rules. Files are scanned whole, so patterns use
+        # [^\S\n] rather than \s to keep every match within a single line.
         self.dangerous_patterns = {
             # Secret exposure patterns
-            r'(?i)(password|passwd|pwd|secret|key|token|api[_-]?key)\s*[:=]\s*["\']?[a-zA-Z0-9]{8,}': 'potential_secret_exposure',
+            # Keywords start a word (db_password) or a camelCase segment (clientSecret)
+            r'(?:(?<![a-zA-Z0-9])(?i:api[_-]?key|password|passwd|secret|token|pwd|key)|(?<=[a-z0-9])(?:Api[_-]?Key|Password|Passwd|Secret|Token|Pwd|Key))[ \t]*[:=][ \t]*["\']?[a-zA-Z0-9]{8,128}': 'potential_secret_exposure',
             r'KEY[a-zA-Z0-9_-]{20,}': 'telnyx_api_key_exposure',
             r'sk_[a-zA-Z0-9]{20,}': 'stripe_key_exposure',
             r'AKIA[0-9A-Z]{16}': 'aws_access_key_exposure',
             
             # Command injection patterns
-            r'os\.system\s*\(': 'command_injection_risk',
-            r'subprocess\.(call|run|Popen)\s*\([^)]*shell\s*=\s*True': 'shell_injection_risk',
-            r'eval\s*\(': 'code_injection_risk',
-            r'exec\s*\(': 'code_injection_risk',
+            r'os\.system[^\S\n]*\(': 'command_injection_risk',
+            r'subprocess\.(?:call|run|Popen)[^\S\n]*\([^)\n]*shell[^\S\n]*=[^\S\n]*True': 'shell_injection_risk',
+            r'eval[^\S\n]*\(': 'code_injection_risk',
+            r'exec[^\S\n]*\(': 'code_injection_risk',
             
             # Insecure network patterns
             r'http://[^/\s]+': 'insecure_http_usage',
-            r'ssl_verify\s*[:=]\s*False': 'ssl_verification_disabled',
-            r'verify\s*=\s*False': 'ssl_verification_disabled',
+            r'ssl_verify[^\S\n]*[:=][^\S\n]*False': 'ssl_verification_disabled',
+            r'verify[^\S\n]*=[^\S\n]*False': 'ssl_verification_disabled',
             
             # Insecure configurations
-            r'DEBUG\s*[:=]\s*True': 'debug_mode_enabled',
+            r'DEBUG[^\S\n]*[:=][^\S\n]*True': 'debug_mode_enabled',
             r'--insecure': 'insecure_flag_usage',
         }
+        
+        # Fuse all patterns into one regex so each file is scanned once. Every
+        # pattern gets its own named group, and the alternation sits inside a
+        # lookahead so overlapping matches (e.g. a token inside a URL) are all found.
+        # All patterns are ASCII, so files are matched as raw bytes without decoding.
+        self.pattern_groups: Dict[str, str] = {}
+        self._group_alternatives: Dict[str, str] = {}
+        for index, (pattern, issue_type) in enumerate(self.dangerous_patterns.items()):
+            group_name = f'{issue_type}_{index}'
+            self.pattern_groups[group_name] = issue_type
+            self._group_alternatives[group_name] = f'(?P<{group_name}>{pattern})'
+        self.union_pattern = self._compile_union(tuple(self.pattern_groups))
+        
+        # Fused patterns restricted to the groups whose literals a file contains
+        self._prefiltered_patterns: Dict[Tuple[str, ...], re.Pattern] = {}
+        
+        # Lines containing any of these are treated as examples or documentation
+        self.skip_pattern = re.compile(rb'example|sample|placeholder|xxx|123|abc|def', re.IGNORECASE)
+    
+    def _compile_union(self, group_names: Tuple[str, ...]) -> re.Pattern:
+        """Compile the lookahead alternation for the given pattern groups"""
+        alternatives = '|'.join(self._group_alternatives[name] for name in group_names)
+        return re.compile(('(?=' + alternatives + ')').encode())
+    
+    def _prefilter_pattern(self, content: bytes) -> Optional[re.Pattern]:
+        """Pick a fused pattern covering only the issue types whose literals occur in content"""
+        lowered = content.lower()
+        group_names = tuple(
+            group_name for group_name, issue_type in self.pattern_groups.items()
+            if issue_type not in ISSUE_LITERALS
+            or any(literal in lowered for literal in ISSUE_LITERALS[issue_type])
+        )
+        if not group_names:
+            return None
+        if len(group_names) == len(self.pattern_groups):
+            return self.union_pattern
+        
+        pattern = self._prefiltered_patterns.get(group_names)
+        if pattern is None:
+            pattern = self._prefiltered_patterns[group_names] = self._compile_union(group_names)
+        return pattern
     
     def validate_environment_variables(self) -> List[SecurityFinding]:
         """Validate environment variable configuration"""
@@ -101,7 +310,9 @@ class TelnyxMCPSecurityValidator:
         
         # Check for insecure environment variable usage
         for var_name, var_value in os.environ.items():
-            if var_name.upper() in ['PASSWORD', 'SECRET', 'TOKEN'] and var_value:
+            if var_name in required_vars:
+                continue
+            if var_value and SENSITIVE_ENV_VAR.search(var_name.upper()):
                 findings.append(SecurityFinding(
                     severity='medium',
                     category='authentication',
@@ -112,56 +323,119 @@ class TelnyxMCPSecurityValidator:
         
         return findings
     
+    def _relative_path(self, file_path: Path) -> str:
+        """Path relative to the project root, via a string slice when possible"""
+        path = str(file_path)
+        if path.startswith(self._root_prefix):
+            return path[len(self._root_prefix):]
+        return str(file_path.relative_to(self.project_path))
+    
     def scan_source_code(self) -> List[SecurityFinding]:
         """Scan source code for security issues"""
-        findings = []
+        file_paths = []
         
-        # File extensions to scan
-        extensions = ['.py', '.js', '.ts', '.sh', '.yaml', '.yml', '.json', '.dockerfile']
-        
-        # Files to exclude from scanning (security tools, test files, etc.)
-        exclude_patterns = [
-            'security/security-validator.py',
-            'security/secrets-manager.py', 
-            'tests/',
-            'monitoring/',
-            '.git/',
-            '__pycache__/',
-            '.pytest_cache/',
-            'node_modules/',
-            'telnyx.yml',  # OpenAPI spec file contains example data
-            'deploy.sh'   # Deployment script may contain example URLs
-        ]
-        
-        for ext in extensions:
-            for file_path in self.project_path.rglob(f'*{ext}'):
-                # Skip excluded files
-                relative_path = str(file_path.relative_to(self.project_path))
-                if any(exclude in relative_path for exclude in exclude_patterns):
+        for root, dirs, files in os.walk(self.project_path):
+            # Prune excluded subtrees before os.walk descends into them
+            dirs[:] = [d for d in dirs if d not in SCAN_EXCLUDE_DIRS]
+            
+            for name in files:
+                if not name.endswith(SCAN_EXTENSIONS):
                     continue
-                    
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        findings.extend(self._scan_file_content(file_path, content))
-                except Exception as e:
-                    logger.warning(f"Could not scan file {file_path}: {e}")
+                
+                file_path = Path(root) / name
+                relative_path = self._relative_path(file_path).replace(os.sep, '/')
+                if ('/' + relative_path).endswith(SCAN_EXCLUDE_FILES):
+                    continue
+                file_paths.append(file_path)
         
+        workers = os.cpu_count() or 1
+        if len(file_paths) >= PARALLEL_SCAN_MIN_FILES and workers > 1:
+            try:
+                return self._scan_files_parallel(file_paths, workers)
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel scan unavailable, scanning sequentially: {e}")
+        
+        findings = []
+        for file_path in file_paths:
+            findings.extend(self._scan_file(file_path))
+        return findings
+    
+    def _scan_files_parallel(self, file_paths: List[Path], workers: int) -> List[SecurityFinding]:
+        """Scan files across worker processes in batches to amortize IPC"""
+        batches = [
+            file_paths[i:i + SCAN_BATCH_SIZE]
+            for i in range(0, len(file_paths), SCAN_BATCH_SIZE)
+        ]
+        
+        findings = []
+        with ProcessPoolExecutor(max_workers=min(workers, len(batches)),
+                                 initializer=_init_scan_worker,
+                                 initargs=(str(self.project_path),)) as executor:
+            for batch_findings in executor.map(_scan_file_batch, batches):
+                findings.extend(batch_findings)
         return findings
     
-    def _scan_file_content(self, file_path: Path, content: str) -> List[SecurityFinding]:
+    def _scan_file(self, file_path: Path) -> List[SecurityFinding]:
+        """Read and scan a single file"""
+        try:
+            # Skip huge files (minified bundles, lockfiles, data dumps) before reading
+            if os.stat(file_path).st_size > MAX_SCAN_FILE_SIZE:
+                logger.info(f"Skipping large file {file_path}")
+                return []
+            
+            with open(file_path, 'rb') as f:
+                content = f.read()
+            
+            # A NUL byte near the start means the file is binary
+            if b'\x00' in content[:BINARY_SNIFF_SIZE]:
+                return []
+            
+            return self._scan_file_content(file_path, content)
+        except Exception as e:
+            logger.warning(f"Could not scan file {file_path}: {e}")
+            return []
+    
+    def _scan_file_content(self, file_path: Path, content: bytes) -> List[SecurityFinding]:
         """Scan individual file content for security issues"""
         findings = []
-        lines = content.split('\n')
         
-        for line_num, line in enumerate(lines, 1):
+        # Run the fused pattern over the whole file, skipping any pattern whose
+        # required literal text is absent
+        pattern = self._prefilter_pattern(content)
+        if pattern is None:
+            return findings
+        matches = list(pattern.finditer(content))
+        if not matches:
+            return findings
+        
+        # Map match offsets to lines by bisecting the newline offsets
+        newlines = array('q', [match.start() for match in NEWLINE.finditer(content)])
+        matches_by_line: Dict[int, set] = {}
+        for match in matches:
+            line_index = bisect_right(newlines, match.start())
+            matches_by_line.setdefault(line_index, set()).add(match.lastgroup)
+        
+        relative_path = self._relative_path(file_path)
+        seen = set()  # (line_number, issue_type) pairs already reported
+        for line_index, matched_groups in matches_by_line.items():
+            line_num = line_index + 1
+            line_start = newlines[line_index - 1] + 1 if line_index else 0
+            line_end = newlines[line_index] if line_index < len(newlines) else len(content)
+            line = content[line_start:line_end]
+            
             # Skip lines that are clearly examples or documentation
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in ['example', 'sample', 'placeholder', 'xxx', '123', 'abc', 'def']):
+            if self.skip_pattern.search(line):
                 continue
+            line = line.decode('utf-8', errors='ignore')
             
-            for pattern, issue_type in self.dangerous_patterns.items():
-                if re.search(pattern, line):
+            for group_name, issue_type in self.pattern_groups.items():
+                if group_name in matched_groups:
+                    # Several patterns can report the same issue type on one line
+                    key = (line_num, issue_type)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    
                     severity, title, description, recommendation = self._get_issue_details(issue_type, line)
                     findings.append(SecurityFinding(
                         severity=severity,
@@ -169,7 +443,7 @@ class TelnyxMCPSecurityValidator:
                         title=title,
                         description=description,
                         recommendation=recommendation,
-                        file_path=str(file_path.relative_to(self.project_path)),
+                        file_path=relative_path,
                         line_number=line_num
                     ))
         
@@ -177,98 +451,12 @@ class TelnyxMCPSecurityValidator:
     
     def _get_issue_details(self, issue_type: str, line: str) -> Tuple[str, str, str, str]:
         """Get detailed information about a security issue"""
-        issue_details = {
-            'potential_secret_exposure': (
-                'high',
-                'Potential secret exposure in source code',
-                f'Line contains what appears to be a hardcoded secret: {line.strip()[:50]}...',
-                'Move secrets to environment variables or secure configuration'
-            ),
-            'telnyx_api_key_exposure': (
-                'critical',
-                'Telnyx API key exposed in source code',
-                'Telnyx API key found in source code',
-                'Remove API key from source code and use environment variables'
-            ),
-            'stripe_key_exposure': (
-                'critical',
-                'Stripe API key exposed in source code',
-                'Stripe API key found in source code',
-                'Remove API key from source code and use environment variables'
-            ),
-            'aws_access_key_exposure': (
-                'critical',
-                'AWS access key exposed in source code',
-                'AWS access key found in source code',
-                'Remove access key from source code and use IAM roles or environment variables'
-            ),
-            'command_injection_risk': (
-                'high',
-                'Command injection vulnerability risk',
-                'Use of os.system() can lead to command injection',
-                'Use subprocess with shell=False or parameterized commands'
-            ),
-            'shell_injection_risk': (
-                'high',
-                'Shell injection vulnerability risk',
-                'Use of shell=True in subprocess can lead to injection',
-                'Use subprocess without shell=True or validate input thoroughly'
-            ),
-            'code_injection_risk': (
-                'critical',
-                'Code injection vulnerability risk',
-                'Use of eval() or exec() can lead to code injection',
-                'Avoid eval() and exec(); use safer alternatives for dynamic code execution'
-            ),
-            'insecure_http_usage': (
-                'medium',
-                'Insecure HTTP usage',
-                'HTTP URLs found - data transmitted in plaintext',
-                'Use HTTPS URLs for secure communication'
-            ),
-            'ssl_verification_disabled': (
-                'high',
-                'SSL verification disabled',
-                'SSL certificate verification is disabled',
-                'Enable SSL verification for secure connections'
-            ),
-            'debug_mode_enabled': (
-                'medium',
-                'Debug mode enabled',
-                'Debug mode can expose sensitive information',
-                'Disable debug mode in production environments'
-            ),
-            'insecure_flag_usage': (
-                'medium',
-                'Insecure flag usage',
-                'Insecure flags found in configuration',
-                'Remove insecure flags from production configuration'
-            ),
-        }
-        
-        return issue_details.get(issue_type, (
-            'info',
-            'Security consideration',
-            'Potential security issue detected',
-            'Review and assess security implications'
-        ))
+        severity, title, description, recommendation = ISSUE_DETAILS.get(issue_type, DEFAULT_ISSUE_DETAILS)
+        return severity, title, description.format(line=line.strip()[:50]), recommendation
     
     def _get_category(self, issue_type: str) -> str:
         """Get security category for issue type"""
-        categories = {
-            'potential_secret_exposure': 'secrets',
-            'telnyx_api_key_exposure': 'secrets',
-            'stripe_key_exposure': 'secrets',
-            'aws_access_key_exposure': 'secrets',
-            'command_injection_risk': 'injection',
-            'shell_injection_risk': 'injection',
-            'code_injection_risk': 'injection',
-            'insecure_http_usage': 'network',
-            'ssl_verification_disabled': 'network',
-            'debug_mode_enabled': 'configuration',
-            'insecure_flag_usage': 'configuration',
-        }
-        return categories.get(issue_type, 'general')
+        return ISSUE_CATEGORIES.get(issue_type, 'general')
     
     def validate_container_security(self) -> List[SecurityFinding]:
         """Validate container security configuration"""
@@ -297,13 +485,13 @@ class TelnyxMCPSecurityValidator:
             line = line.strip()
             
             # Check for non-root user
-            if re.match(r'^USER\s+(?!root)', line):
+            if DOCKERFILE_USER_NON_ROOT.match(line):
                 has_non_root_user = True
-            elif re.match(r'^USER\s+root', line):
+            elif DOCKERFILE_USER_ROOT.match(line):
                 runs_as_root = True
             
             # Check for package update without cleanup
-            if re.search(r'apt-get\s+update.*&&.*apt-get\s+install', line):
+            if DOCKERFILE_APT_INSTALL.search(line):
                 if 'rm -rf /var/lib/apt/lists/*' not in line and 'rm -rf /var/lib/apt/lists/*' not in content:
                     findings.append(SecurityFinding(
                         severity='low',
@@ -311,19 +499,19 @@ class TelnyxMCPSecurityValidator:
                         title='Package cache not cleaned up',
                         description='Package manager cache should be cleaned to reduce image size',
                         recommendation='Add "rm -rf /var/lib/apt/lists/*" after package installation',
-                        file_path=str(file_path.relative_to(self.project_path)),
+                        file_path=self._relative_path(file_path),
                         line_number=line_num
                     ))
             
             # Check for COPY/ADD with overly broad permissions
-            if re.match(r'^(COPY|ADD).*--chown=root', line):
+            if DOCKERFILE_CHOWN_ROOT.match(line):
                 findings.append(SecurityFinding(
                     severity='medium',
                     category='container',
                     title='Files copied with root ownership',
                     description='Files should not be owned by root unless necessary',
                     recommendation='Use a non-root user for file ownership',
-                    file_path=str(file_path.relative_to(self.project_path)),
+                    file_path=self._relative_path(file_path),
                     line_number=line_num
                 ))
         
@@ -335,7 +523,7 @@ class TelnyxMCPSecurityValidator:
                 title='Container runs as root user',
                 description='Container should run as a non-root user for security',
                 recommendation='Add a non-root user and use USER directive',
-                file_path=str(file_path.relative_to(self.project_path))
+                file_path=self._relative_path(file_path)
             ))
         
         return findings
@@ -348,9 +536,8 @@ class TelnyxMCPSecurityValidator:
         smithery_yaml = self.project_path / 'smithery.yaml'
         if smithery_yaml.exists():
             try:
-                with open(smithery_yaml, 'r') as f:
-                    config = yaml.safe_load(f)
-                    findings.extend(self._validate_smithery_config(config, smithery_yaml))
+                config = self._load_config_file(smithery_yaml)
+                findings.extend(self._validate_smithery_config(config, smithery_yaml))
             except Exception as e:
                 logger.warning(f"Could not validate smithery.yaml: {e}")
         
@@ -358,14 +545,29 @@ class TelnyxMCPSecurityValidator:
         smithery_json = self.project_path / 'smithery.json'
         if smithery_json.exists():
             try:
-                with open(smithery_json, 'r') as f:
-                    config = json.load(f)
-                    findings.extend(self._validate_smithery_json_config(config, smithery_json))
+                config = self._load_config_file(smithery_json)
+                findings.extend(self._validate_smithery_json_config(config, smithery_json))
             except Exception as e:
                 logger.warning(f"Could not validate smithery.json: {e}")
         
         return findings
     
+    def _load_config_file(self, file_path: Path) -> Any:
+        """Parse a YAML or JSON config file, reusing the result while it is unchanged"""
+        mtime_ns = file_path.stat().st_mtime_ns
+        cached = self._config_cache.get(file_path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        with open(file_path, 'r') as f:
+            if file_path.suffix == '.json':
+                config = json.load(f)
+            else:
+                config = yaml.load(f, Loader=YamlLoader)
+        
+        self._config_cache[file_path] = (mtime_ns, config)
+        return config
+    
     def _validate_smithery_config(self, config: Dict[str, Any], file_path: Path) -> List[SecurityFinding]:
         """Validate smithery.yaml security configuration"""
         findings = []
@@ -383,7 +585,7 @@ class TelnyxMCPSecurityValidator:
                         title='Root filesystem not read-only',
                         description='Container should use read-only root filesystem',
                         recommendation='Set deployment.security.readOnlyRootFilesystem to true',
-                        file_path=str(file_path.relative_to(self.project_path))
+                        file_path=self._relative_path(file_path)
                     ))
                 
                 if security.get('runAsNonRoot', True) is False:
@@ -393,7 +595,7 @@ class TelnyxMCPSecurityValidator:
                         title='Container configured to run as root',
                         description='Container should not run as root user',
                         recommendation='Set deployment.security.runAsNonRoot to true',
-                        file_path=str(file_path.relative_to(self.project_path))
+                        file_path=self._relative_path(file_path)
                     ))
         
         # Check for insecure configuration
@@ -408,7 +610,7 @@ class TelnyxMCPSecurityValidator:
                         title='TLS disabled for ingress',
                         description='Ingress should use TLS encryption',
                         recommendation='Set networking.ingress.tls to true',
-                        file_path=str(file_path.relative_to(self.project_path))
+                        file_path=self._relative_path(file_path)
                     ))
         
         return findings
@@ -427,7 +629,7 @@ class TelnyxMCPSecurityValidator:
                     title='Authentication not required',
                     description='Server should require authentication',
                     recommendation='Set authentication.required to true',
-                    file_path=str(file_path.relative_to(self.project_path))
+                    file_path=self._relative_path(file_path)
                 ))
         
         # Check security section
@@ -442,44 +644,39 @@ class TelnyxMCPSecurityValidator:
                     title='PII handling without proper encryption',
                     description='PII data should be encrypted in transit and at rest',
                     recommendation='Ensure proper encryption is configured for PII data',
-                    file_path=str(file_path.relative_to(self.project_path))
+                    file_path=self._relative_path(file_path)
                 ))
         
         return findings
     
     def generate_security_report(self) -> Dict[str, Any]:
         """Generate comprehensive security report"""
+        # Repeat calls reuse the previous scan until invalidate() is called
+        if self._report is not None:
+            return self._report
+        
         logger.info("Starting security validation...")
         
         # Run all security checks
-        self.findings.extend(self.validate_environment_variables())
-        self.findings.extend(self.scan_source_code())
-        self.findings.extend(self.validate_container_security())
-        self.findings.extend(self.validate_configuration_files())
+        self.findings = (
+            self.validate_environment_variables()
+            + self.scan_source_code()
+            + self.validate_container_security()
+            + self.validate_configuration_files()
+        )
         
         # Categorize findings by severity
-        severity_counts = {}
-        category_counts = {}
-        
-        for finding in self.findings:
-            severity_counts[finding.severity] = severity_counts.get(finding.severity, 0) + 1
-            category_counts[finding.category] = category_counts.get(finding.category, 0) + 1
+        severity_counts = dict(Counter(finding.severity for finding in self.findings))
+        category_counts = dict(Counter(finding.category for finding in self.findings))
         
         # Calculate security score (100 - deductions)
-        score = 100
-        for finding in self.findings:
-            if finding.severity == 'critical':
-                score -= 30
-            elif finding.severity == 'high':
-                score -= 20
-            elif finding.severity == 'medium':
-                score -= 10
-            elif finding.severity == 'low':
-                score -= 5
-        
+        score = 100 - sum(
+            SEVERITY_DEDUCTIONS.get(severity, 0) * count
+            for severity, count in severity_counts.items()
+        )
         score = max(0, score)
         
-        return {
+        self._report = {
             'timestamp': str(datetime.now()),
             'security_score': score,
             'total_findings': len(self.findings),
@@ -498,6 +695,27 @@ class TelnyxMCPSecurityValidator:
                 for f in self.findings
             ]
         }
+        return self._report
+    
+    def invalidate(self) -> None:
+        """Discard the cached report so the next report rescans the project"""
+        self._report = None
+        self.findings = []
+
+# Validator used by scan worker processes, built once per worker
+_worker_validator: Optional[TelnyxMCPSecurityValidator] = None
+
+def _init_scan_worker(project_path: str) -> None:
+    """Compile the scan patterns once in each worker process"""
+    global _worker_validator
+    _worker_validator = TelnyxMCPSecurityValidator(project_path)
+
+def _scan_file_batch(file_paths: List[Path]) -> List[SecurityFinding]:
+    """Scan a batch of files in a worker process"""
+    findings = []
+    for file_path in file_paths:
+        findings.extend(_worker_validator._scan_file(file_path))
+    return findings
 
 def main():
     """Main entry point"""
@@ -520,7 +738,10 @@ def main():
     report = validator.generate_security_report()
     
     if args.json:
-        print(json.dumps(report, indent=2))
+        if orjson is not None:
+            sys.stdout.buffer.write(orjson.dumps(report, option=orjson.OPT_INDENT_2) + b'\n')
+        else:
+            print(json.dumps(report, indent=2))
     else:
         print(f"\n=== Telnyx MCP Server Security Report ===")
         print(f"Security Score: {report['security_score']}/100")
@@ -12,15 +12,33 @@ import os
 import time
 import subprocess
 import signal
+import sys
+import tempfile
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from pathlib import Path
+from urllib.parse import urlsplit
 import docker
 from dataclasses import dataclass
 
+try:
+    import orjson  # Optional faster JSON parser
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# JSON parser for response bodies; both accept bytes
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# Tag of the image built for Docker-based test runs; kept between runs as a layer cache
+TEST_IMAGE_TAG = 'telnyx-mcp-test:latest'
+
+# Concurrent /health requests fired by test_performance; the connector's per-host
+# limit matches it so the burst never queues for a connection
+PERFORMANCE_BURST = 10
+
 @dataclass
 class TestResult:
     """Test result data structure"""
@@ -33,13 +51,21 @@ class TestResult:
 class TelnyxMCPIntegrationTest:
     """Integration test suite for Telnyx MCP Server"""
     
-    def __init__(self, server_url: str = "http://localhost:8080", project_path: str = "."):
+    def __init__(self, server_url: str = "http://localhost:8080", project_path: str = ".",
+                 cleanup_images: bool = False):
         self.server_url = server_url.rstrip('/')
         self.project_path = Path(project_path).resolve()
         self.results: List[TestResult] = []
         self.server_process = None
+        self.server_log = None
+        # Keep the server log for inspection unless every test passed
+        self._keep_server_log = True
         self.docker_container = None
         self.docker_client = None
+        self._remove_image_on_exit = cleanup_images
+        self._build_context = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._timeout = aiohttp.ClientTimeout(total=10, connect=2, sock_read=5)
         
         # Initialize Docker client
         try:
@@ -47,19 +73,33 @@ class TelnyxMCPIntegrationTest:
         except Exception as e:
             logger.warning(f"Docker client initialization failed: {e}")
     
+    async def _tcp_probe(self, timeout: float = 0.25) -> bool:
+        """Check whether anything is listening on the server's host and port"""
+        url = urlsplit(self.server_url)
+        port = url.port or (443 if url.scheme == 'https' else 80)
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(url.hostname, port), timeout=timeout)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        await writer.wait_closed()
+        return True
+    
     async def setup_test_environment(self) -> bool:
         """Setup test environment and start server"""
         logger.info("Setting up test environment...")
         
-        # Check if server is already running
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.server_url}/health", timeout=5) as response:
+        # Check if server is already running: a cheap connect first, then a short health request
+        if await self._tcp_probe():
+            try:
+                async with self._session.get(
+                    f"{self.server_url}/health", timeout=aiohttp.ClientTimeout(total=1)
+                ) as response:
                     if response.status == 200:
                         logger.info("Server already running - using existing instance")
                         return True
-        except:
-            pass
+            except:
+                pass
         
         # Try to start server locally first
         if await self.start_local_server():
@@ -72,6 +112,26 @@ class TelnyxMCPIntegrationTest:
         logger.error("Failed to start test server")
         return False
     
+    async def _wait_healthy(self, deadline_s: float, is_alive: Callable[[], bool] = lambda: True) -> bool:
+        """Poll the health endpoint with backoff until it returns 200 or the deadline passes"""
+        deadline = time.monotonic() + deadline_s
+        interval = 0.2
+        
+        while time.monotonic() < deadline and is_alive():
+            try:
+                async with self._session.get(
+                    f"{self.server_url}/health", timeout=aiohttp.ClientTimeout(total=1)
+                ) as response:
+                    if response.status == 200:
+                        return True
+            except Exception:
+                pass
+            
+            await asyncio.sleep(interval)
+            interval = min(interval * 1.5, 1.0)
+        
+        return False
+    
     async def start_local_server(self) -> bool:
         """Start server locally using uvx"""
         try:
@@ -91,47 +151,80 @@ class TelnyxMCPIntegrationTest:
                 '--api-base-url', 'https://api.telnyx.com/v2'
             ]
             
+            # Send output to a log file: undrained pipes would block the server once full
+            self.server_log = tempfile.NamedTemporaryFile(prefix='telnyx-mcp-', suffix='.log', delete=False)
             self.server_process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdout=self.server_log,
+                stderr=subprocess.STDOUT,
                 cwd=str(self.project_path)
             )
             
-            # Wait for server to start
-            await asyncio.sleep(5)
-            
-            # Check if server is running
-            if self.server_process.poll() is None:
-                try:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(f"{self.server_url}/health", timeout=5) as response:
-                            if response.status == 200:
-                                logger.info("Local server started successfully")
-                                return True
-                except:
-                    pass
+            # Wait for server to start, giving up early if the process exits
+            if await self._wait_healthy(15, lambda: self.server_process.poll() is None):
+                logger.info("Local server started successfully")
+                return True
             
             # Server failed to start
+            logger.warning(f"Local server did not become healthy; output in {self.server_log.name}")
             self.server_process.terminate()
             self.server_process = None
+            self.server_log.close()
+            self.server_log = None
             return False
             
         except Exception as e:
             logger.error(f"Failed to start local server: {e}")
             return False
     
+    def _get_build_context(self):
+        """Tar the build context once per process and rewind it for each build"""
+        if self._build_context is None:
+            exclude = None
+            dockerignore = self.project_path / '.dockerignore'
+            if dockerignore.exists():
+                exclude = [
+                    line.strip() for line in dockerignore.read_text().splitlines()
+                    if line.strip() and not line.strip().startswith('#')
+                ]
+            self._build_context = docker.utils.tar(
+                str(self.project_path),
+                exclude=exclude,
+                dockerfile=('deployment/Dockerfile', None)
+            )
+        self._build_context.seek(0)
+        return self._build_context
+    
+    def _build_test_image(self):
+        """Build the test image, reusing layers from the previously built tag"""
+        # The Docker SDK talks to the classic builder, not BuildKit: DOCKER_BUILDKIT and
+        # BUILDKIT_INLINE_CACHE have no effect here, and RUN --mount cache mounts in
+        # deployment/Dockerfile would fail to build. Layer reuse relies on cache_from.
+        stream = self.docker_client.api.build(
+            fileobj=self._get_build_context(),
+            custom_context=True,
+            dockerfile='deployment/Dockerfile',
+            tag=TEST_IMAGE_TAG,
+            # Pin the daemon's native platform so the build neither probes other
+            # architectures nor runs under emulation
+            platform=f"linux/{self.docker_client.version()['Arch']}",
+            cache_from=[TEST_IMAGE_TAG],
+            pull=False,
+            nocache=False,
+            rm=True,
+            decode=True
+        )
+        for chunk in stream:
+            if 'error' in chunk:
+                raise docker.errors.BuildError(chunk['error'], [])
+        return self.docker_client.images.get(TEST_IMAGE_TAG)
+    
     async def start_docker_server(self) -> bool:
         """Start server using Docker"""
         try:
             # Build Docker image
             logger.info("Building Docker image for testing...")
-            image, build_logs = self.docker_client.images.build(
-                path=str(self.project_path),
-                dockerfile='deployment/Dockerfile',
-                tag='telnyx-mcp-test:latest',
-                rm=True
-            )
+            image = await asyncio.to_thread(self._build_test_image)
             
             # Start container
             logger.info("Starting Docker container...")
@@ -146,19 +239,10 @@ class TelnyxMCPIntegrationTest:
                 name='telnyx-mcp-test'
             )
             
-            # Wait for container to start
-            await asyncio.sleep(10)
-            
-            # Check if container is running and server is responding
-            if self.docker_container.status == 'running':
-                try:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(f"{self.server_url}/health", timeout=5) as response:
-                            if response.status == 200:
-                                logger.info("Docker server started successfully")
-                                return True
-                except:
-                    pass
+            # Wait for container to start and the server to respond
+            if await self._wait_healthy(30):
+                logger.info("Docker server started successfully")
+                return True
             
             # Container failed to start properly
             self.docker_container.stop()
@@ -170,10 +254,18 @@ class TelnyxMCPIntegrationTest:
             logger.error(f"Failed to start Docker server: {e}")
             return False
     
+    async def _close_session(self):
+        """Close the shared HTTP session"""
+        if self._session:
+            await self._session.close()
+            self._session = None
+    
     async def cleanup_test_environment(self):
         """Cleanup test environment"""
         logger.info("Cleaning up test environment...")
         
+        await self._close_session()
+        
         # Stop local server process
         if self.server_process:
             try:
@@ -183,6 +275,17 @@ class TelnyxMCPIntegrationTest:
                 self.server_process.kill()
             self.server_process = None
         
+        if self.server_log:
+            self.server_log.close()
+            if self._keep_server_log:
+                logger.warning(f"Local server output kept in {self.server_log.name}")
+            else:
+                try:
+                    os.unlink(self.server_log.name)
+                except OSError:
+                    pass
+            self.server_log = None
+        
         # Stop and remove Docker container
         if self.docker_container:
             try:
@@ -192,75 +295,77 @@ class TelnyxMCPIntegrationTest:
                 pass
             self.docker_container = None
         
-        # Clean up Docker images
-        if self.docker_client:
+        # The test image is kept so the next build can reuse its layers, unless asked otherwise
+        if self.docker_client and self._remove_image_on_exit:
             try:
-                self.docker_client.images.remove('telnyx-mcp-test:latest', force=True)
+                self.docker_client.images.remove(TEST_IMAGE_TAG, force=True)
             except:
                 pass
     
     async def test_server_health(self) -> TestResult:
         """Test server health endpoint"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.server_url}/health", timeout=10) as response:
-                    duration = time.time() - start_time
-                    
-                    if response.status == 200:
-                        return TestResult(
-                            test_name="Server Health Check",
-                            status="pass",
-                            message="Health endpoint responding correctly",
-                            duration_seconds=duration,
-                            details={"status_code": response.status}
-                        )
-                    else:
-                        return TestResult(
-                            test_name="Server Health Check",
-                            status="fail",
-                            message=f"Health endpoint returned status {response.status}",
-                            duration_seconds=duration,
-                            details={"status_code": response.status}
-                        )
+            async with self._session.get(f"{self.server_url}/health") as response:
+                duration = time.perf_counter() - start_time
+                
+                if response.status == 200:
+                    return TestResult(
+                        test_name="Server Health Check",
+                        status="pass",
+                        message="Health endpoint responding correctly",
+                        duration_seconds=duration,
+                        details={"status_code": response.status}
+                    )
+                else:
+                    return TestResult(
+                        test_name="Server Health Check",
+                        status="fail",
+                        message=f"Health endpoint returned status {response.status}",
+                        duration_seconds=duration,
+                        details={"status_code": response.status}
+                    )
         except Exception as e:
             return TestResult(
                 test_name="Server Health Check",
                 status="fail",
                 message=f"Health check failed: {str(e)}",
-                duration_seconds=time.time() - start_time
+                duration_seconds=time.perf_counter() - start_time
             )
     
     async def test_mcp_capabilities(self) -> TestResult:
         """Test MCP capabilities endpoints"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            capabilities = {}
             endpoints_to_test = ['/tools', '/resources', '/prompts']
             
-            async with aiohttp.ClientSession() as session:
-                for endpoint in endpoints_to_test:
-                    try:
-                        async with session.get(f"{self.server_url}{endpoint}", timeout=10) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                capabilities[endpoint] = {
-                                    'status': response.status,
-                                    'count': len(data.get(endpoint.strip('/'), []))
-                                }
-                            else:
-                                capabilities[endpoint] = {
-                                    'status': response.status,
-                                    'error': f'HTTP {response.status}'
-                                }
-                    except Exception as e:
-                        capabilities[endpoint] = {
-                            'error': str(e)
-                        }
+            async def probe(endpoint: str) -> Dict[str, Any]:
+                try:
+                    async with self._session.get(f"{self.server_url}{endpoint}") as response:
+                        if response.status == 200:
+                            # Parse the raw bytes directly; only the item count is kept
+                            data = json_loads(await response.read())
+                            return {
+                                'status': response.status,
+                                'count': len(data.get(endpoint.strip('/'), []))
+                            }
+                        else:
+                            return {
+                                'status': response.status,
+                                'error': f'HTTP {response.status}'
+                            }
+                except Exception as e:
+                    return {
+                        'error': str(e)
+                    }
+            
+            # Endpoints are independent, so probe them concurrently
+            probes = await asyncio.gather(*(probe(endpoint) for endpoint in endpoints_to_test))
+            capabilities = dict(zip(endpoints_to_test, probes))
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             # Check if at least one endpoint worked
             successful_endpoints = [ep for ep, data in capabilities.items() if data.get('status') == 200]
@@ -288,12 +393,12 @@ class TelnyxMCPIntegrationTest:
                 test_name="MCP Capabilities",
                 status="fail",
                 message=f"MCP capabilities test failed: {str(e)}",
-                duration_seconds=time.time() - start_time
+                duration_seconds=time.perf_counter() - start_time
             )
     
     async def test_api_authentication(self) -> TestResult:
         """Test API authentication configuration"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # This test validates that the server properly handles authentication
         # by making a request that would require valid Telnyx API credentials
@@ -310,166 +415,155 @@ class TelnyxMCPIntegrationTest:
                 "id": 1
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.server_url}/mcp",
-                    json=test_payload,
-                    headers={'Content-Type': 'application/json'},
-                    timeout=15
-                ) as response:
-                    duration = time.time() - start_time
-                    response_data = await response.json()
-                    
-                    # We expect either:
-                    # - Success (200) if API key is valid
-                    # - Unauthorized (401) if API key is invalid but server is working
-                    # - Error response but proper JSON-RPC format
-                    
-                    if response.status in [200, 401, 403]:
-                        if 'jsonrpc' in response_data:
-                            return TestResult(
-                                test_name="API Authentication",
-                                status="pass",
-                                message="Server properly handles authentication",
-                                duration_seconds=duration,
-                                details={
-                                    "status_code": response.status,
-                                    "response": response_data
-                                }
-                            )
-                    
-                    return TestResult(
-                        test_name="API Authentication",
-                        status="warning",
-                        message=f"Unexpected response format (status: {response.status})",
-                        duration_seconds=duration,
-                        details={"status_code": response.status, "response": response_data}
-                    )
+            async with self._session.post(
+                f"{self.server_url}/mcp",
+                json=test_payload,
+                headers={'Content-Type': 'application/json'},
+                timeout=aiohttp.ClientTimeout(total=15)  # Upstream Telnyx call needs longer
+            ) as response:
+                duration = time.perf_counter() - start_time
+                response_data = await response.json()
+                
+                # We expect either:
+                # - Success (200) if API key is valid
+                # - Unauthorized (401) if API key is invalid but server is working
+                # - Error response but proper JSON-RPC format
+                
+                if response.status in [200, 401, 403]:
+                    if 'jsonrpc' in response_data:
+                        return TestResult(
+                            test_name="API Authentication",
+                            status="pass",
+                            message="Server properly handles authentication",
+                            duration_seconds=duration,
+                            details={
+                                "status_code": response.status,
+                                "response": response_data
+                            }
+                        )
+                
+                return TestResult(
+                    test_name="API Authentication",
+                    status="warning",
+                    message=f"Unexpected response format (status: {response.status})",
+                    duration_seconds=duration,
+                    details={"status_code": response.status, "response": response_data}
+                )
                     
         except asyncio.TimeoutError:
             return TestResult(
                 test_name="API Authentication",
                 status="fail",
                 message="Authentication test timed out",
-                duration_seconds=time.time() - start_time
+                duration_seconds=time.perf_counter() - start_time
             )
         except Exception as e:
             return TestResult(
                 test_name="API Authentication",
                 status="fail",
                 message=f"Authentication test failed: {str(e)}",
-                duration_seconds=time.time() - start_time
+                duration_seconds=time.perf_counter() - start_time
             )
     
     async def test_performance(self) -> TestResult:
         """Test server performance with multiple requests"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Make multiple concurrent requests to test performance
-            async with aiohttp.ClientSession() as session:
-                tasks = []
-                
-                # Create 10 concurrent health check requests
-                for i in range(10):
-                    task = session.get(f"{self.server_url}/health")
-                    tasks.append(task)
-                
-                # Execute requests concurrently
-                responses = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Analyze results
-                successful_requests = 0
-                total_response_time = 0
-                
-                for response in responses:
-                    if isinstance(response, aiohttp.ClientResponse):
-                        if response.status == 200:
-                            successful_requests += 1
-                        response.close()
-                
-                duration = time.time() - start_time
-                avg_response_time = duration / len(tasks)
+            async def health_request() -> int:
+                async with self._session.get(f"{self.server_url}/health") as response:
+                    await response.read()  # Drain the body so the connection is reused at once
+                    return response.status
+            
+            # Execute concurrent health check requests over the shared pool
+            tasks = [health_request() for _ in range(PERFORMANCE_BURST)]
+            statuses = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Analyze results
+            successful_requests = sum(1 for status in statuses if status == 200)
+            
+            duration = time.perf_counter() - start_time
+            avg_response_time = duration / len(tasks)
                 
-                if successful_requests >= 8:  # At least 80% success rate
-                    return TestResult(
-                        test_name="Performance Test",
-                        status="pass",
-                        message=f"Performance test passed ({successful_requests}/{len(tasks)} requests successful)",
-                        duration_seconds=duration,
-                        details={
-                            "total_requests": len(tasks),
-                            "successful_requests": successful_requests,
-                            "avg_response_time": avg_response_time,
-                            "success_rate": successful_requests / len(tasks)
-                        }
-                    )
-                else:
-                    return TestResult(
-                        test_name="Performance Test",
-                        status="fail",
-                        message=f"Performance test failed ({successful_requests}/{len(tasks)} requests successful)",
-                        duration_seconds=duration,
-                        details={
-                            "total_requests": len(tasks),
-                            "successful_requests": successful_requests,
-                            "avg_response_time": avg_response_time,
-                            "success_rate": successful_requests / len(tasks)
-                        }
-                    )
+            if successful_requests >= 8:  # At least 80% success rate
+                return TestResult(
+                    test_name="Performance Test",
+                    status="pass",
+                    message=f"Performance test passed ({successful_requests}/{len(tasks)} requests successful)",
+                    duration_seconds=duration,
+                    details={
+                        "total_requests": len(tasks),
+                        "successful_requests": successful_requests,
+                        "avg_response_time": avg_response_time,
+                        "success_rate": successful_requests / len(tasks)
+                    }
+                )
+            else:
+                return TestResult(
+                    test_name="Performance Test",
+                    status="fail",
+                    message=f"Performance test failed ({successful_requests}/{len(tasks)} requests successful)",
+                    duration_seconds=duration,
+                    details={
+                        "total_requests": len(tasks),
+                        "successful_requests": successful_requests,
+                        "avg_response_time": avg_response_time,
+                        "success_rate": successful_requests / len(tasks)
+                    }
+                )
                     
         except Exception as e:
             return TestResult(
                 test_name="Performance Test",
                 status="fail",
                 message=f"Performance test failed: {str(e)}",
-                duration_seconds=time.time() - start_time
+                duration_seconds=time.perf_counter() - start_time
             )
     
     async def test_error_handling(self) -> TestResult:
         """Test server error handling"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            error_scenarios = []
-            
-            async with aiohttp.ClientSession() as session:
-                # Test invalid endpoint
+            async def check_invalid_endpoint() -> Dict[str, Any]:
                 try:
-                    async with session.get(f"{self.server_url}/invalid-endpoint", timeout=5) as response:
-                        error_scenarios.append({
+                    async with self._session.get(f"{self.server_url}/invalid-endpoint") as response:
+                        return {
                             "test": "invalid_endpoint",
                             "status": response.status,
                             "handled_gracefully": response.status in [404, 405]
-                        })
+                        }
                 except Exception as e:
-                    error_scenarios.append({
+                    return {
                         "test": "invalid_endpoint",
                         "error": str(e),
                         "handled_gracefully": False
-                    })
-                
-                # Test malformed JSON request
+                    }
+            
+            async def check_malformed_json() -> Dict[str, Any]:
                 try:
-                    async with session.post(
+                    async with self._session.post(
                         f"{self.server_url}/mcp",
                         data="invalid json",
-                        headers={'Content-Type': 'application/json'},
-                        timeout=5
+                        headers={'Content-Type': 'application/json'}
                     ) as response:
-                        error_scenarios.append({
+                        return {
                             "test": "malformed_json",
                             "status": response.status,
                             "handled_gracefully": response.status in [400, 422]
-                        })
+                        }
                 except Exception as e:
-                    error_scenarios.append({
+                    return {
                         "test": "malformed_json",
                         "error": str(e),
                         "handled_gracefully": False
-                    })
+                    }
+            
+            # Test invalid endpoint and malformed JSON request concurrently
+            error_scenarios = list(await asyncio.gather(check_invalid_endpoint(), check_malformed_json()))
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             # Check if errors were handled gracefully
             graceful_handling = all(scenario.get('handled_gracefully', False) for scenario in error_scenarios)
@@ -496,15 +590,52 @@ class TelnyxMCPIntegrationTest:
                 test_name="Error Handling",
                 status="fail",
                 message=f"Error handling test failed: {str(e)}",
-                duration_seconds=time.time() - start_time
+                duration_seconds=time.perf_counter() - start_time
+            )
+    
+    async def _invoke(self, test_case) -> TestResult:
+        """Run one test case, logging its outcome and converting errors into a failed result"""
+        try:
+            logger.info(f"Running {test_case.__name__}...")
+            result = await test_case()
+            
+            status_icon = {
+                'pass': '✅',
+                'warning': '⚠️',
+                'fail': '❌',
+                'skip': '⏭️'
+            }.get(result.status, '❓')
+            
+            logger.info(f"{status_icon} {result.test_name}: {result.message} ({result.duration_seconds:.1f}s)")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Test case {test_case.__name__} failed: {e}")
+            return TestResult(
+                test_name=test_case.__name__.replace('test_', '').replace('_', ' ').title(),
+                status="fail",
+                message=f"Test execution failed: {str(e)}",
+                duration_seconds=0.0
             )
     
     async def run_integration_tests(self) -> Dict[str, Any]:
         """Run complete integration test suite"""
         logger.info("Starting Telnyx MCP Server integration tests...")
+        self._keep_server_log = True
+        
+        # One pooled session for setup and every test, so requests reuse keepalive connections;
+        # the server host is resolved once and cached for the whole run
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, limit_per_host=max(16, PERFORMANCE_BURST), keepalive_timeout=300,
+                use_dns_cache=True, ttl_dns_cache=None
+            ),
+            timeout=self._timeout
+        )
         
         # Setup test environment
         if not await self.setup_test_environment():
+            await self._close_session()
             return {
                 'timestamp': str(datetime.now()),
                 'overall_status': 'fail',
@@ -518,42 +649,21 @@ class TelnyxMCPIntegrationTest:
                 self.test_server_health,
                 self.test_mcp_capabilities,
                 self.test_api_authentication,
-                self.test_performance,
                 self.test_error_handling
             ]
             
-            results = []
-            
-            # Run each test case
-            for test_case in test_cases:
-                try:
-                    logger.info(f"Running {test_case.__name__}...")
-                    result = await test_case()
-                    results.append(result)
-                    
-                    status_icon = {
-                        'pass': '✅',
-                        'warning': '⚠️',
-                        'fail': '❌',
-                        'skip': '⏭️'
-                    }.get(result.status, '❓')
-                    
-                    logger.info(f"{status_icon} {result.test_name}: {result.message} ({result.duration_seconds:.1f}s)")
-                    
-                except Exception as e:
-                    logger.error(f"Test case {test_case.__name__} failed: {e}")
-                    results.append(TestResult(
-                        test_name=test_case.__name__.replace('test_', '').replace('_', ' ').title(),
-                        status="fail",
-                        message=f"Test execution failed: {str(e)}",
-                        duration_seconds=0.0
-                    ))
+            # Test cases share no mutable state, so run them concurrently
+            results = list(await asyncio.gather(*(self._invoke(test_case) for test_case in test_cases)))
+            # The performance burst runs alone afterwards: sharing the pool with the
+            # other tests would make it wait on connections and skew its timings
+            results.insert(3, await self._invoke(self.test_performance))
             
             # Calculate summary
             total_tests = len(results)
             passed_tests = len([r for r in results if r.status == 'pass'])
             failed_tests = len([r for r in results if r.status == 'fail'])
             warning_tests = len([r for r in results if r.status == 'warning'])
+            self._keep_server_log = passed_tests != total_tests
             
             # Determine overall status
             if failed_tests > 0:
@@ -601,10 +711,12 @@ async def main():
                        help='Output results in JSON format')
     parser.add_argument('--fail-on-warnings', action='store_true',
                        help='Exit with code 1 if warnings found')
+    parser.add_argument('--cleanup-images', action='store_true',
+                       help='Remove the Docker test image after the run (disables layer reuse)')
     
     args = parser.parse_args()
     
-    test_suite = TelnyxMCPIntegrationTest(args.server_url, args.project_path)
+    test_suite = TelnyxMCPIntegrationTest(args.server_url, args.project_path, cleanup_images=args.cleanup_images)
     report = await test_suite.run_integration_tests()
     
     if args.json:
@@ -646,4 +758,9 @@ async def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop  # Optional libuv-based event loop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
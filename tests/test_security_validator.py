@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the secret exposure pattern in security/security-validator.py
+Run with: python -m unittest discover -s tests -p 'test_*.py'
+"""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+
+VALIDATOR_PATH = Path(__file__).resolve().parent.parent / 'security' / 'security-validator.py'
+
+spec = importlib.util.spec_from_file_location('security_validator', VALIDATOR_PATH)
+security_validator = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(security_validator)
+
+
+class SecretExposurePatternTest(unittest.TestCase):
+    """Keyword boundaries of the potential_secret_exposure pattern"""
+
+    def scan(self, line: str) -> list:
+        """Return the issue types found in a one-line Python file"""
+        with tempfile.TemporaryDirectory() as project_dir:
+            (Path(project_dir) / 'app.py').write_text(line + '\n')
+            validator = security_validator.TelnyxMCPSecurityValidator(project_dir)
+            return [finding.title for finding in validator.scan_source_code()]
+
+    def assertSecretReported(self, line: str):
+        self.assertIn('Potential secret exposure in source code', self.scan(line), line)
+
+    def assertSecretNotReported(self, line: str):
+        self.assertNotIn('Potential secret exposure in source code', self.scan(line), line)
+
+    def test_camel_case_credentials_are_reported(self):
+        self.assertSecretReported('clientSecret="Zq8Wm4Lp9Tr2"')
+        self.assertSecretReported('accessToken=Zq8Wm4Lp9Tr2')
+        self.assertSecretReported('dbPassword = "Zq8Wm4Lp9Tr2"')
+        self.assertSecretReported('myApiKey: Zq8Wm4Lp9Tr2')
+
+    def test_word_start_credentials_are_reported(self):
+        self.assertSecretReported('DB_PASSWORD=Zq8Wm4Lp9Tr2')
+        self.assertSecretReported('api_key: "Zq8Wm4Lp9Tr2"')
+
+    def test_camel_case_names_without_credential_values_are_quiet(self):
+        self.assertSecretNotReported('encodedKey = None')
+        self.assertSecretNotReported('progressToken: str')
+
+    def test_keywords_inside_lowercase_words_are_quiet(self):
+        self.assertSecretNotReported('monkey=Zq8Wm4Lp9Tr2')
+        self.assertSecretNotReported('turnkey: Zq8Wm4Lp9Tr2')
+
+
+class RelativePathTest(unittest.TestCase):
+    """Walked files share the root prefix however the project path is spelled"""
+
+    def assertFastRelativePaths(self, project_path: str):
+        validator = security_validator.TelnyxMCPSecurityValidator(project_path)
+        with mock.patch.object(Path, 'relative_to', side_effect=AssertionError('slow path')):
+            paths = {finding.file_path for finding in validator.scan_source_code()}
+        self.assertEqual(paths, {os.path.join('src', 'app.py')})
+
+    def test_project_paths(self):
+        with tempfile.TemporaryDirectory() as project_dir:
+            (Path(project_dir) / 'src').mkdir()
+            (Path(project_dir) / 'src' / 'app.py').write_text('password = "Zq8Wm4Lp9Tr2"\n')
+            self.assertFastRelativePaths(os.path.join(project_dir, 'src', '..', ''))
+
+            cwd = os.getcwd()
+            os.chdir(project_dir)
+            try:
+                self.assertFastRelativePaths('.')
+            finally:
+                os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    unittest.main()